@@ -2,24 +2,27 @@
 Flask routes for API layer. Thin controllers delegate to Application layer.
 """
 
-from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime
+from flask import Blueprint, request, current_app, stream_with_context
 
-from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime
-
-from ..infrastructure.persistence.sqlalchemy_repo import SQLAlchemyFinanceEntryRepository
-from ..application.entry_service import FinanceEntryService
 from ..domain.finance_entry.services import validate_entry_data
+from ..domain.finance_entry.exceptions import EntryNotFound
+from ..infrastructure.json_provider import dumps_bytes
 
 api_bp = Blueprint("api", __name__)
 
+# Rows serialized per chunk written to the client by GET /entries.
+ENTRIES_CHUNK_ROWS = 1000
+
+# Constant health payload, encoded once at import time.
+_HEALTH_BYTES = dumps_bytes({"status": "ok"})
+
+def json_response(payload, status=200):
+    """Build a JSON response from pre-encoded bytes, skipping the str intermediate."""
+    return current_app.response_class(dumps_bytes(payload), status=status, mimetype="application/json")
+
 def get_service():
-    # Singleton per app
-    if not hasattr(current_app, "_finance_entry_service"):
-        repo = SQLAlchemyFinanceEntryRepository()
-        current_app._finance_entry_service = FinanceEntryService(repo)
-    return current_app._finance_entry_service
+    # Singleton per app, built once in create_app()
+    return current_app.extensions["finance_service"]
 
 @api_bp.route("/entries", methods=["GET"])
 # PUBLIC_INTERFACE
@@ -29,10 +32,25 @@ def get_entries():
     Returns: {"entries": [...], "running_total": float}
     """
     service = get_service()
-    entries = service.list()
-    data = [e.as_dict() for e in entries]
-    running_total = sum(e.amount for e in entries)
-    return jsonify({"entries": data, "running_total": running_total}), 200
+
+    def generate():
+        # Stream the body in chunks so memory stays bounded by ENTRIES_CHUNK_ROWS.
+        # Plain dicts serialize directly; orjson renders the date as YYYY-MM-DD.
+        yield b'{"entries":['
+        running_total = 0.0
+        chunk = []
+        separator = b""
+        for entry, running_total in service.iter_with_total(ENTRIES_CHUNK_ROWS):
+            chunk.append(dumps_bytes(entry))
+            if len(chunk) == ENTRIES_CHUNK_ROWS:
+                yield separator + b",".join(chunk)
+                separator = b","
+                chunk = []
+        if chunk:
+            yield separator + b",".join(chunk)
+        yield b'],"running_total":' + dumps_bytes(running_total) + b"}"
+
+    return current_app.response_class(stream_with_context(generate()), status=200, mimetype="application/json")
 
 @api_bp.route("/entries", methods=["POST"])
 # PUBLIC_INTERFACE
@@ -44,30 +62,43 @@ def add_entry():
     """
     data = request.get_json(force=True, silent=True)
     if not data:
-        return jsonify({"error": "Request body must be JSON"}), 400
+        return json_response({"error": "Request body must be JSON"}, 400)
     try:
-        # Validation is done via value objects logic in the domain service.
-        validate_entry_data(data)
+        # Validation is done via value objects logic in the domain service,
+        # which also hands back the parsed values (e.g. date as datetime.date).
+        fields = validate_entry_data(data)
         service = get_service()
-        # Construct date argument robustly: accept ISO string or date object
-        entry_date = data.get("date")
-        if isinstance(entry_date, str):
-            try:
-                entry_date = datetime.strptime(entry_date, "%Y-%m-%d").date()
-            except Exception:
-                # Delegate parsing error to EntryDate value object
-                pass
         entry = service.create(
-            description=data["description"],
-            amount=data["amount"],
-            category=data["category"],
-            entry_date=entry_date
+            description=fields["description"],
+            amount=fields["amount"],
+            category=fields["category"],
+            entry_date=fields["date"]
         )
-        return jsonify(entry.as_dict()), 201
-    except Exception as e:
-        # All exceptions should be handled by the application/domain/service; rollback infra if required.
-        # The repository itself should also handle its own transactions.
-        return jsonify({"error": str(e)}), 400
+    except ValueError as e:
+        # Validation errors are raised by the domain value object rules.
+        # The repository itself handles its own transactions.
+        return json_response({"error": str(e)}, 400)
+    return json_response(entry.as_dict(), 201)
+
+@api_bp.route("/entries:batch", methods=["POST"])
+# PUBLIC_INTERFACE
+def add_entries_batch():
+    """
+    Add many finance entries in one transaction.
+    Request JSON: array of objects with description, amount, category, date
+    Returns: 201 with {"created": count}, or 400 if any entry is invalid.
+    """
+    data = request.get_json(force=True, silent=True)
+    if not isinstance(data, list):
+        return json_response({"error": "Request body must be a JSON array"}, 400)
+    items = []
+    for index, item in enumerate(data):
+        try:
+            items.append(validate_entry_data(item))
+        except ValueError as e:
+            return json_response({"error": f"Entry {index}: {e}"}, 400)
+    created = get_service().create_many(items)
+    return json_response({"created": created}, 201)
 
 @api_bp.route("/entries/<int:entry_id>", methods=["PUT"])
 # PUBLIC_INTERFACE
@@ -79,27 +110,16 @@ def update_entry(entry_id):
     """
     data = request.get_json(force=True, silent=True)
     if not data:
-        return jsonify({"error": "Request body must be JSON"}), 400
+        return json_response({"error": "Request body must be JSON"}, 400)
     try:
-        validate_entry_data(data, for_update=True)
+        fields = validate_entry_data(data, for_update=True)
         service = get_service()
-        update_fields = {}
-        for field in ["description", "amount", "category", "date"]:
-            if field in data:
-                # If "date" is provided as string, convert to date
-                if field == "date" and isinstance(data[field], str):
-                    try:
-                        update_fields[field] = datetime.strptime(data[field], "%Y-%m-%d").date()
-                    except Exception:
-                        update_fields[field] = data[field]  # let domain/value object throw
-                else:
-                    update_fields[field] = data[field]
-        entry = service.update(entry_id, **update_fields)
-        return jsonify(entry.as_dict()), 200
-    except Exception as e:
-        if "Not found" in str(e):
-            return jsonify({"error": "Entry not found"}), 404
-        return jsonify({"error": str(e)}), 400
+        entry = service.update(entry_id, **fields)
+    except EntryNotFound:
+        return json_response({"error": "Entry not found"}, 404)
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+    return json_response(entry.as_dict(), 200)
 
 @api_bp.route("/entries/<int:entry_id>", methods=["DELETE"])
 # PUBLIC_INTERFACE
@@ -109,13 +129,14 @@ def delete_entry(entry_id):
     Returns: 200 on success, 404 if not found
     """
     service = get_service()
-    ok = service.delete(entry_id)
-    if ok:
-        return jsonify({"message": f"Entry {entry_id} deleted"}), 200
-    return jsonify({"error": "Entry not found"}), 404
+    try:
+        service.delete(entry_id)
+    except EntryNotFound:
+        return json_response({"error": "Entry not found"}, 404)
+    return json_response({"message": f"Entry {entry_id} deleted"}, 200)
 
 @api_bp.route("/health", methods=["GET"])
 # PUBLIC_INTERFACE
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "ok"}), 200
+    return current_app.response_class(_HEALTH_BYTES, status=200, mimetype="application/json")
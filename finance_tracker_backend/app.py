@@ -6,22 +6,35 @@ from flask import Flask
 from flask_cors import CORS
 from .config.settings import Config
 from .infrastructure.persistence.db_models import db
+from .infrastructure.persistence.sqlite_pragmas import enable_sqlite_pragmas
+from .infrastructure.persistence.query_budget import install_query_budget
+from .infrastructure.json_provider import ORJSONProvider
+from .infrastructure.persistence.sqlalchemy_repo import SQLAlchemyFinanceEntryRepository
+from .application.entry_service import FinanceEntryService
 from .api.routes import api_bp
 
 # PUBLIC_INTERFACE
 def create_app():
     """
     Factory function to create and configure the Flask app instance.
-    Sets up Flask, SQLAlchemy, and initializes the database.
+    Sets up Flask and SQLAlchemy; creates the database schema only when
+    AUTO_CREATE_SCHEMA is enabled.
     Wires API, DB, CORS, etc.
     """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config.from_object(Config)
     db.init_app(app)
+    repo = SQLAlchemyFinanceEntryRepository(cache_size=app.config["ENTRY_CACHE_SIZE"])
+    app.extensions["finance_service"] = FinanceEntryService(repo)
     CORS(app)
+    if app.config.get("SQLALCHEMY_RECORD_QUERIES", False):
+        install_query_budget(app)
 
     with app.app_context():
-        db.create_all()
+        enable_sqlite_pragmas(db.engine)
+        if app.config.get("AUTO_CREATE_SCHEMA", False):
+            db.create_all()
         # Import blueprints here so they're registered AFTER app/db config.
         app.register_blueprint(api_bp)
 
@@ -29,4 +42,6 @@ def create_app():
 
 if __name__ == "__main__":
     app = create_app()
+    with app.app_context():
+        db.create_all()
     app.run(debug=True, host="0.0.0.0", port=5000)
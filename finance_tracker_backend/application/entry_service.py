@@ -2,9 +2,13 @@
 Application service orchestrating finance entry use cases.
 """
 
-from typing import Optional, List
+from datetime import date
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from ..domain.finance_entry.entities import FinanceEntry
 from ..domain.finance_entry.repository import FinanceEntryRepository
+from ..domain.finance_entry.exceptions import EntryNotFound
+from ..domain.finance_entry.services import ENTRY_FIELD_SET
+from ..domain.finance_entry.value_objects import to_float
 
 # PUBLIC_INTERFACE
 class FinanceEntryService:
@@ -16,34 +20,71 @@ class FinanceEntryService:
         self.repo = repo
 
     # PUBLIC_INTERFACE
-    def list(self) -> List[FinanceEntry]:
-        return self.repo.list_entries()
+    def list(self, limit: Optional[int] = None, after: Optional[Tuple[date, int]] = None) -> Iterator[FinanceEntry]:
+        return self.repo.list_entries(limit=limit, after=after)
 
     # PUBLIC_INTERFACE
-    def get(self, entry_id: int) -> Optional[FinanceEntry]:
-        return self.repo.get_by_id(entry_id)
+    def list_raw(self) -> List[dict]:
+        return self.repo.list_entries_raw()
+
+    # PUBLIC_INTERFACE
+    def iter_with_total(self, batch_size: int = 1000) -> Iterator[Tuple[dict, float]]:
+        return self.repo.iter_entries_with_total(batch_size)
+
+    # PUBLIC_INTERFACE
+    def total(self) -> float:
+        return self.repo.sum_amount()
+
+    # PUBLIC_INTERFACE
+    def get(self, entry_id: int, cold: bool = False) -> Optional[FinanceEntry]:
+        return self.repo.get_by_id(entry_id, cold=cold)
+
+    # PUBLIC_INTERFACE
+    def get_many(self, ids: Iterable[int]) -> Dict[int, FinanceEntry]:
+        return self.repo.get_many(ids)
 
     # PUBLIC_INTERFACE
     def create(self, description, amount, category, entry_date) -> FinanceEntry:
         entry = FinanceEntry(
             id=None,
             description=description,
-            amount=float(amount),
+            amount=to_float(amount),
             category=category,
-            entry_date=entry_date
+            date=entry_date
         )
         return self.repo.add(entry)
 
+    # PUBLIC_INTERFACE
+    def create_many(self, entries: List[dict]) -> int:
+        """Create entries from validated field dicts in a single batch."""
+        return self.repo.bulk_add([
+            FinanceEntry(
+                id=None,
+                description=e["description"],
+                amount=to_float(e["amount"]),
+                category=e["category"],
+                date=e["date"]
+            )
+            for e in entries
+        ])
+
     # PUBLIC_INTERFACE
     def update(self, entry_id, **kwargs) -> FinanceEntry:
-        entry = self.repo.get_by_id(entry_id)
+        fields = {
+            field: kwargs[field]
+            for field in ENTRY_FIELD_SET & kwargs.keys()
+            if kwargs[field] is not None
+        }
+        if fields:
+            entry = self.repo.update_fields(entry_id, fields)
+        else:
+            entry = self.repo.get_by_id(entry_id)
         if not entry:
-            raise ValueError("Not found")
-        for field in ["description", "amount", "category", "date"]:
-            if field in kwargs and kwargs[field] is not None:
-                setattr(entry, field, kwargs[field])
-        return self.repo.update(entry)
+            raise EntryNotFound(entry_id)
+        return entry
 
     # PUBLIC_INTERFACE
     def delete(self, entry_id) -> bool:
-        return self.repo.delete(entry_id)
+        if not self.repo.delete(entry_id):
+            raise EntryNotFound(entry_id)
+        return True
@@ -4,8 +4,39 @@ Application configuration for Flask and SQLAlchemy.
 
 import os
 
+from sqlalchemy.engine import make_url
+
+# PUBLIC_INTERFACE
+def engine_options(uri: str) -> dict:
+    """Return SQLAlchemy create_engine options for the given database URI."""
+    options = {
+        "future": True,
+        "query_cache_size": 1200,
+        "pool_pre_ping": True,
+        "insertmanyvalues_page_size": 1000,
+    }
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite":
+        # Keep warm connections to networked databases so requests skip the connect handshake.
+        # (SQLite file/memory pools are managed by SQLAlchemy/Flask-SQLAlchemy defaults.)
+        options.update(pool_size=10, max_overflow=20, pool_recycle=1800)
+    if url.get_driver_name() == "psycopg2":
+        # Batch executemany UPDATE/DELETE through psycopg2's execute_batch as well.
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
 # PUBLIC_INTERFACE
 class Config:
     """Base configuration object for Flask app."""
     SQLALCHEMY_DATABASE_URI = os.getenv("FINANCE_DB_URI", "sqlite:///finance_db.sqlite")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Create missing tables on startup; meant for local development only.
+    AUTO_CREATE_SCHEMA = os.getenv("FLASK_ENV") == "development"
+    # Entries cached per process by get_by_id; 0 disables. Thread-safe, but other worker
+    # processes' writes are not seen, so only enable it with a single worker process.
+    ENTRY_CACHE_SIZE = int(os.getenv("FINANCE_ENTRY_CACHE_SIZE", "0"))
+    # Development-only N+1 guard: record queries and flag requests that exceed the budget.
+    SQLALCHEMY_RECORD_QUERIES = os.getenv("FLASK_ENV") == "development"
+    MAX_QUERIES_PER_REQUEST = int(os.getenv("FINANCE_MAX_QUERIES_PER_REQUEST", "10"))
+    QUERY_BUDGET_RAISE = os.getenv("FINANCE_QUERY_BUDGET_RAISE") == "1"
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
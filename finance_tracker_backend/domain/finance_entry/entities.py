@@ -3,25 +3,23 @@ FinanceEntry entity for Domain Layer.
 Domain entity is decoupled from persistence/ORM specifics.
 """
 
+from dataclasses import dataclass
 from datetime import date
+from typing import Optional
+
+_KEYS = ("id", "description", "amount", "category", "date")
 
 # PUBLIC_INTERFACE
+@dataclass(slots=True)
 class FinanceEntry:
     """Domain entity for finance entry (Aggregate Root)."""
-    def __init__(self, id: int, description: str, amount: float, category: str, entry_date: date):
-        self.id = id
-        self.description = description
-        self.amount = amount
-        self.category = category
-        self.date = entry_date
+    id: Optional[int]
+    description: str
+    amount: float
+    category: str
+    date: date
 
     # PUBLIC_INTERFACE
     def as_dict(self):
         """Return dictionary representation for serialization."""
-        return dict(
-            id=self.id,
-            description=self.description,
-            amount=self.amount,
-            category=self.category,
-            date=self.date.isoformat()
-        )
+        return dict(zip(_KEYS, (self.id, self.description, self.amount, self.category, self.date.isoformat())))
@@ -0,0 +1,7 @@
+"""
+Domain exceptions for the FinanceEntry aggregate.
+"""
+
+# PUBLIC_INTERFACE
+class EntryNotFound(LookupError):
+    """Raised when a finance entry with the requested ID does not exist."""
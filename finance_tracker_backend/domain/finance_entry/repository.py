@@ -3,34 +3,94 @@ Repository contract for FinanceEntry aggregate.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
 from .entities import FinanceEntry
 
 # PUBLIC_INTERFACE
 class FinanceEntryRepository(ABC):
-    """Repository interface for FinanceEntry aggregates."""
+    """
+    Repository interface for FinanceEntry aggregates.
+    Mutating methods commit by default; pass autocommit=False to defer the
+    commit to an enclosing unit_of_work().
+    """
 
     @abstractmethod
-    def list_entries(self) -> list:
-        """Return all finance entries."""
+    def list_entries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[FinanceEntry]:
+        """
+        Iterate over finance entries newest first (date desc, id desc), fetched in batches of batch_size.
+        limit caps the number of entries; after=(date, id) of the last entry of the
+        previous page resumes just past it (keyset pagination).
+        """
         pass
 
     @abstractmethod
-    def get_by_id(self, entry_id: int) -> Optional[FinanceEntry]:
-        """Find entry by ID."""
+    def list_entries_raw(self) -> List[dict]:
+        """Return all finance entries as plain dicts, in list order."""
         pass
 
     @abstractmethod
-    def add(self, entry: FinanceEntry) -> FinanceEntry:
+    def iter_entries_with_total(self, batch_size: int = 1000) -> Iterator[Tuple[dict, float]]:
+        """Stream (entry dict, sum of all amounts) pairs in list order."""
+        pass
+
+    @abstractmethod
+    def sum_amount(self) -> float:
+        """Return the sum of all entry amounts."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, entry_id: int, cold: bool = False) -> Optional[FinanceEntry]:
+        """
+        Find entry by ID.
+        cold=True is for read-only callers: it may bypass ORM/identity-map
+        machinery and read the row directly.
+        """
+        pass
+
+    @abstractmethod
+    def get_many(self, ids: Iterable[int]) -> Dict[int, FinanceEntry]:
+        """Find entries by ID in one lookup; missing IDs are absent from the result."""
+        pass
+
+    @abstractmethod
+    def add(self, entry: FinanceEntry, autocommit: bool = True) -> FinanceEntry:
         """Add a new FinanceEntry."""
         pass
 
     @abstractmethod
-    def update(self, entry: FinanceEntry) -> FinanceEntry:
+    def bulk_add(self, entries: List[FinanceEntry], autocommit: bool = True, return_ids: bool = False) -> int:
+        """
+        Add many FinanceEntries in one transaction; return the number added.
+        With return_ids=True the generated ids are also set on the entries.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, entry: FinanceEntry, autocommit: bool = True) -> FinanceEntry:
         """Update an existing FinanceEntry."""
         pass
 
     @abstractmethod
-    def delete(self, entry_id: int) -> bool:
+    def update_fields(self, entry_id: int, fields: dict, autocommit: bool = True) -> Optional[FinanceEntry]:
+        """Apply field changes to an entry by ID; return the updated entry or None if not found."""
+        pass
+
+    @abstractmethod
+    def delete(self, entry_id: int, autocommit: bool = True) -> bool:
         """Delete an entry by ID."""
         pass
+
+    @abstractmethod
+    def unit_of_work(self) -> ContextManager["FinanceEntryRepository"]:
+        """
+        Transaction boundary for several mutations.
+        Mutations called with autocommit=False inside the block are committed
+        together on exit, or rolled back if the block raises.
+        """
+        pass
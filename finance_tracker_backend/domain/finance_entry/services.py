@@ -3,29 +3,34 @@ Domain-layer business logic (domain services) for FinanceEntry.
 """
 
 from .entities import FinanceEntry
-from .value_objects import Description, Amount, Category, EntryDate
+from .value_objects import validate_description, validate_amount, validate_category, validate_date
+
+ENTRY_FIELDS = ("description", "amount", "category", "date")
+ENTRY_FIELD_SET = frozenset(ENTRY_FIELDS)
+
+_NORMALIZERS = {
+    "description": validate_description,
+    "amount": validate_amount,
+    "category": validate_category,
+    "date": validate_date,
+}
 
 # PUBLIC_INTERFACE
 def validate_entry_data(data, for_update=False):
     """
-    Validate data for finance entry using value objects logic.
+    Validate data for finance entry using the value object rules.
     Throws ValueError for invalid data.
+    Returns a dict of the supplied fields with normalized values
+    (stripped strings, float amount, datetime.date date).
     """
-    required = ["description", "amount", "category", "date"]
+    if not isinstance(data, dict):
+        raise ValueError("Entry data must be a JSON object")
+    present = ENTRY_FIELD_SET & data.keys()
     if for_update:
-        if not any(f in data for f in required):
+        if not present:
             raise ValueError("At least one field (description, amount, category, date) required for update")
     else:
-        missing = [f for f in required if f not in data]
+        missing = [f for f in ENTRY_FIELDS if f not in present]
         if missing:
             raise ValueError(f"Missing fields: {', '.join(missing)}")
-    if "description" in data:
-        Description(data["description"])
-    if "amount" in data:
-        Amount(data["amount"])
-    if "category" in data:
-        Category(data["category"])
-    if "date" in data:
-        EntryDate(data["date"])
-    # All validations passed if no exception thrown
-    return True
+    return {f: _NORMALIZERS[f](data[f]) for f in present}
@@ -2,15 +2,71 @@
 Domain value objects for finance entry attributes.
 """
 
+import math
 from datetime import date
 
+
+def _parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD string.
+    date.fromisoformat is far cheaper than strptime, but on Python 3.11+ it
+    also accepts other ISO 8601 shapes (e.g. 20240102, 2024-W01-1), so the
+    fixed layout is checked first.
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(value)
+    return date.fromisoformat(value)
+
+# PUBLIC_INTERFACE
+def validate_description(value) -> str:
+    """Return the stripped description; raise ValueError if empty."""
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Description cannot be empty")
+    return value.strip()
+
+# PUBLIC_INTERFACE
+def to_float(value) -> float:
+    """float(value), skipping the conversion when value is already a float."""
+    return value if type(value) is float else float(value)
+
+# PUBLIC_INTERFACE
+def validate_amount(value) -> float:
+    """Return the amount as float; raise ValueError if not a finite number."""
+    try:
+        amount = to_float(value)
+    except Exception:
+        raise ValueError("Amount must be a valid number")
+    # NaN/Infinity can't be stored (SQLite turns NaN into NULL) or encoded as JSON numbers.
+    if not math.isfinite(amount):
+        raise ValueError("Amount must be a finite number")
+    # Add possible domain rules here (e.g., no negative if required)
+    return amount
+
+# PUBLIC_INTERFACE
+def validate_category(value) -> str:
+    """Return the stripped category; raise ValueError if empty."""
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Category cannot be empty")
+    return value.strip()
+
+# PUBLIC_INTERFACE
+def validate_date(value) -> date:
+    """Return the value as datetime.date; raise ValueError if invalid."""
+    if isinstance(value, str):
+        try:
+            return _parse_date(value)
+        except Exception:
+            raise ValueError("Invalid date format (use YYYY-MM-DD)")
+    elif isinstance(value, date):
+        return value
+    else:
+        raise ValueError("Date must be a string or a datetime.date instance")
+
 # PUBLIC_INTERFACE
 class Description:
     """Description value object."""
     def __init__(self, value: str):
-        if not value or not value.strip():
-            raise ValueError("Description cannot be empty")
-        self.value = value.strip()
+        self.value = validate_description(value)
 
     def __str__(self):
         return self.value
@@ -19,11 +75,7 @@ class Description:
 class Amount:
     """Amount value object."""
     def __init__(self, value):
-        try:
-            self.value = float(value)
-        except Exception:
-            raise ValueError("Amount must be a valid number")
-        # Add possible domain rules here (e.g., no negative if required)
+        self.value = validate_amount(value)
 
     def __float__(self):
         return self.value
@@ -32,9 +84,7 @@ class Amount:
 class Category:
     """Category value object."""
     def __init__(self, value: str):
-        if not value or not value.strip():
-            raise ValueError("Category cannot be empty")
-        self.value = value.strip()
+        self.value = validate_category(value)
 
     def __str__(self):
         return self.value
@@ -43,15 +93,7 @@ class Category:
 class EntryDate:
     """EntryDate value object."""
     def __init__(self, value):
-        if isinstance(value, str):
-            try:
-                self.value = date.fromisoformat(value)
-            except Exception:
-                raise ValueError("Invalid date format (use YYYY-MM-DD)")
-        elif isinstance(value, date):
-            self.value = value
-        else:
-            raise ValueError("Date must be a string or a datetime.date instance")
+        self.value = validate_date(value)
 
     def __str__(self):
         return self.value.isoformat()
@@ -0,0 +1,37 @@
+"""
+orjson-backed JSON support for Flask (Infrastructure layer).
+"""
+
+from collections.abc import Mapping
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """Fallback serializer for types orjson does not handle natively."""
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if isinstance(obj, Mapping):
+        # e.g. SQLAlchemy RowMapping from Result.mappings()
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# PUBLIC_INTERFACE
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj straight to UTF-8 JSON bytes."""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+# PUBLIC_INTERFACE
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider using orjson for dumps/loads."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -16,3 +16,8 @@ class FinanceEntryORM(db.Model):
     amount = db.Column(db.Float, nullable=False)
     category = db.Column(db.String(64), nullable=False)
     date = db.Column(db.Date, nullable=False)
+
+
+# Descending composite index matching the (date DESC, id DESC) list ordering,
+# so listing and keyset pagination are index range scans with no sort step.
+db.Index("ix_entry_date_id_desc", FinanceEntryORM.date.desc(), FinanceEntryORM.id.desc())
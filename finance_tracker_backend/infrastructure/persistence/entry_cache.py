@@ -0,0 +1,63 @@
+"""
+Process-local LRU cache of FinanceEntry objects keyed by ID (Infrastructure layer).
+"""
+
+from collections import OrderedDict
+from dataclasses import replace
+from threading import Lock
+from typing import Optional
+
+from ...domain.finance_entry.entities import FinanceEntry
+
+# PUBLIC_INTERFACE
+class EntryCache:
+    """
+    Thread-safe LRU cache for entries looked up by ID.
+    Entries are copied on the way in and out so callers can't mutate cached state.
+    A maxsize of 0 disables caching.
+
+    Every invalidation bumps a generation counter. Readers take generation()
+    before querying and pass it to put(), which drops the entry if an
+    invalidation happened meanwhile, so a row read before a concurrent commit
+    can't be cached after that commit's invalidation.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._generation = 0
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, entry_id: int) -> Optional[FinanceEntry]:
+        with self._lock:
+            entry = self._data.get(entry_id)
+            if entry is None:
+                return None
+            self._data.move_to_end(entry_id)
+        return replace(entry)
+
+    def put(self, entry: FinanceEntry, generation: int):
+        if self.maxsize <= 0:
+            return
+        entry = replace(entry)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._data[entry.id] = entry
+            self._data.move_to_end(entry.id)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, entry_id: int):
+        with self._lock:
+            self._data.pop(entry_id, None)
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
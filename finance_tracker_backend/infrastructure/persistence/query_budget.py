@@ -0,0 +1,26 @@
+"""
+Per-request SQL query budget to surface N+1 patterns in development (Infrastructure layer).
+"""
+
+from flask import request
+from flask_sqlalchemy.record_queries import get_recorded_queries
+
+# PUBLIC_INTERFACE
+def install_query_budget(app):
+    """
+    Check each request's recorded queries against MAX_QUERIES_PER_REQUEST.
+    Logs a warning when the budget is exceeded, or raises if QUERY_BUDGET_RAISE is set
+    (useful in tests so a regression fails loudly). Requires SQLALCHEMY_RECORD_QUERIES.
+    """
+
+    # teardown_request rather than after_request: streamed bodies (GET /entries) run
+    # their queries after after_request, but before the request context is torn down.
+    @app.teardown_request
+    def _check_query_budget(exc):
+        budget = app.config["MAX_QUERIES_PER_REQUEST"]
+        count = len(get_recorded_queries())
+        if count > budget:
+            message = f"{request.method} {request.path} issued {count} queries (budget {budget}); possible N+1"
+            if app.config.get("QUERY_BUDGET_RAISE", False):
+                raise RuntimeError(message)
+            app.logger.warning(message)
@@ -2,28 +2,132 @@
 SQLAlchemy-backed implementation of FinanceEntryRepository.
 """
 
+from contextlib import contextmanager
 from datetime import date
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+
+from sqlalchemy import bindparam, delete as sa_delete, func, insert, select, tuple_, update as sa_update
 
 from .db_models import db, FinanceEntryORM
+from .entry_cache import EntryCache
 from ...domain.finance_entry.repository import FinanceEntryRepository
 from ...domain.finance_entry.entities import FinanceEntry
+from ...domain.finance_entry.exceptions import EntryNotFound
+
+# Columns in FinanceEntry constructor order.
+_ENTRY_COLUMNS = (
+    FinanceEntryORM.id,
+    FinanceEntryORM.description,
+    FinanceEntryORM.amount,
+    FinanceEntryORM.category,
+    FinanceEntryORM.date,
+)
+_LIST_ORDER = (FinanceEntryORM.date.desc(), FinanceEntryORM.id.desc())
+
+# Statements built once at import; each call only binds parameters and executes.
+_LIST_STMT = select(*_ENTRY_COLUMNS).order_by(*_LIST_ORDER)
+_LIST_WITH_TOTAL_STMT = select(
+    *_ENTRY_COLUMNS,
+    func.sum(FinanceEntryORM.amount).over().label("running_total"),
+).order_by(*_LIST_ORDER)
+_SUM_STMT = select(func.coalesce(func.sum(FinanceEntryORM.amount), 0.0))
+_GET_BY_ID_STMT = select(*_ENTRY_COLUMNS).where(FinanceEntryORM.id == bindparam("id"))
+
+# db.session.info key for entry ids written with autocommit=False and not yet committed.
+_PENDING_INVALIDATIONS = "finance_entry_pending_invalidations"
+# db.session.info flag for uncommitted bulk inserts whose ids aren't known.
+_PENDING_INSERTS = "finance_entry_pending_inserts"
+
+def _end_mutation(autocommit: bool):
+    # Commit now, or just flush so ids/rowcounts are known and leave the commit to the caller.
+    if autocommit:
+        db.session.commit()
+    else:
+        db.session.flush()
 
 # PUBLIC_INTERFACE
 class SQLAlchemyFinanceEntryRepository(FinanceEntryRepository):
-    """SQLAlchemy implementation of FinanceEntryRepository."""
+    """
+    SQLAlchemy implementation of FinanceEntryRepository.
+    cache_size > 0 enables a process-local get_by_id cache. It is invalidated after
+    this repository's own writes commit (safe across threads), but never sees writes
+    made by other processes, so only enable it when a single process owns the data.
+    """
 
-    def list_entries(self) -> List[FinanceEntry]:
-        entries = FinanceEntryORM.query.order_by(FinanceEntryORM.date.desc(), FinanceEntryORM.id.desc()).all()
-        return [FinanceEntry(e.id, e.description, e.amount, e.category, e.date) for e in entries]
+    def __init__(self, cache_size: int = 0):
+        self._cache = EntryCache(cache_size)
 
-    def get_by_id(self, entry_id: int) -> Optional[FinanceEntry]:
-        obj = FinanceEntryORM.query.get(entry_id)
-        if not obj:
-            return None
-        return FinanceEntry(obj.id, obj.description, obj.amount, obj.category, obj.date)
+    def _written(self, entry_id: int, autocommit: bool):
+        # Called once the mutation has ended: committed writes are invalidated now,
+        # deferred ones when the enclosing unit_of_work() commits or rolls back.
+        if autocommit:
+            self._cache.invalidate(entry_id)
+        else:
+            db.session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(entry_id)
+
+    def list_entries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[FinanceEntry]:
+        # Selecting columns rather than the mapped class skips ORM instance hydration and
+        # the identity map; yield_per streams rows in batches.
+        stmt = _LIST_STMT
+        if after is not None:
+            # Keyset pagination: continue strictly after the (date, id) of the last row seen.
+            stmt = stmt.where(tuple_(FinanceEntryORM.date, FinanceEntryORM.id) < tuple_(*after))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        for row in db.session.execute(stmt, execution_options={"yield_per": batch_size}):
+            yield FinanceEntry(*row)
+
+    def list_entries_raw(self) -> List[dict]:
+        # Column projection returns plain rows, skipping ORM instance hydration.
+        return [row._asdict() for row in db.session.execute(_LIST_STMT)]
 
-    def add(self, entry: FinanceEntry) -> FinanceEntry:
+    def iter_entries_with_total(self, batch_size: int = 1000) -> Iterator[Tuple[dict, float]]:
+        # SUM(amount) OVER () yields the total alongside every row in the same scan;
+        # yield_per streams rows from the cursor in batches instead of buffering them all.
+        for row in db.session.execute(_LIST_WITH_TOTAL_STMT, execution_options={"yield_per": batch_size}):
+            entry = row._asdict()
+            total = entry.pop("running_total")
+            yield entry, total
+
+    def sum_amount(self) -> float:
+        return db.session.scalar(_SUM_STMT)
+
+    def get_by_id(self, entry_id: int, cold: bool = False) -> Optional[FinanceEntry]:
+        cached = self._cache.get(entry_id)
+        if cached is not None:
+            return cached
+        generation = self._cache.generation()
+        if cold:
+            # Core column select: no identity-map probe, ORM instance or instrumentation.
+            row = db.session.execute(_GET_BY_ID_STMT, {"id": entry_id}).mappings().first()
+            if row is None:
+                return None
+            entry = FinanceEntry(**row)
+        else:
+            obj = db.session.get(FinanceEntryORM, entry_id)
+            if not obj:
+                return None
+            entry = FinanceEntry(obj.id, obj.description, obj.amount, obj.category, obj.date)
+        # Don't cache reads made while this session holds uncommitted writes.
+        info = db.session.info
+        if not info.get(_PENDING_INVALIDATIONS) and not info.get(_PENDING_INSERTS):
+            self._cache.put(entry, generation)
+        return entry
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, FinanceEntry]:
+        ids = list(ids)
+        if not ids:
+            return {}
+        # One SELECT ... WHERE id IN (...) instead of a get_by_id round trip per id.
+        stmt = select(*_ENTRY_COLUMNS).where(FinanceEntryORM.id.in_(ids))
+        return {row.id: FinanceEntry(*row) for row in db.session.execute(stmt)}
+
+    def add(self, entry: FinanceEntry, autocommit: bool = True) -> FinanceEntry:
         new_obj = FinanceEntryORM(
             description=entry.description,
             amount=entry.amount,
@@ -31,25 +135,97 @@ class SQLAlchemyFinanceEntryRepository(FinanceEntryRepository):
             date=entry.date
         )
         db.session.add(new_obj)
-        db.session.commit()
+        # Read the id after flush: after commit it would be expired and reloaded with a SELECT.
+        db.session.flush()
         entry.id = new_obj.id
+        if autocommit:
+            db.session.commit()
+        # A rolled-back insert's id is reused by SQLite, so it must not stay cached.
+        self._written(entry.id, autocommit)
         return entry
 
-    def update(self, entry: FinanceEntry) -> FinanceEntry:
-        obj = FinanceEntryORM.query.get(entry.id)
-        if not obj:
-            raise ValueError("Entry not found")
-        obj.description = entry.description
-        obj.amount = entry.amount
-        obj.category = entry.category
-        obj.date = entry.date
-        db.session.commit()
+    def bulk_add(self, entries: List[FinanceEntry], autocommit: bool = True, return_ids: bool = False) -> int:
+        if not entries:
+            return 0
+        mappings = [
+            {"description": e.description, "amount": e.amount, "category": e.category, "date": e.date}
+            for e in entries
+        ]
+        if not return_ids:
+            # Plain executemany: batched by insertmanyvalues into a few multi-row INSERTs.
+            db.session.execute(insert(FinanceEntryORM), mappings)
+        else:
+            # Ordered RETURNING: batched on PostgreSQL via the autoincrement PK; dialects that
+            # can't guarantee row order in a batch (SQLite included) issue one INSERT per row.
+            stmt = insert(FinanceEntryORM).returning(FinanceEntryORM.id, sort_by_parameter_order=True)
+            ids = db.session.execute(stmt, mappings).scalars().all()
+        if autocommit:
+            db.session.commit()
+        else:
+            db.session.info[_PENDING_INSERTS] = True
+        if return_ids:
+            for entry, new_id in zip(entries, ids):
+                entry.id = new_id
+                self._written(new_id, autocommit)
+        return len(entries)
+
+    def update(self, entry: FinanceEntry, autocommit: bool = True) -> FinanceEntry:
+        # Single UPDATE by primary key; no SELECT or ORM hydration first.
+        result = db.session.execute(
+            sa_update(FinanceEntryORM)
+            .where(FinanceEntryORM.id == entry.id)
+            .values(
+                description=entry.description,
+                amount=entry.amount,
+                category=entry.category,
+                date=entry.date
+            )
+        )
+        # End the transaction before reporting a miss, so SQLite's write lock
+        # taken by the UPDATE is not held until request teardown.
+        _end_mutation(autocommit)
+        if result.rowcount == 0:
+            raise EntryNotFound(entry.id)
+        self._written(entry.id, autocommit)
         return entry
 
-    def delete(self, entry_id: int) -> bool:
-        obj = FinanceEntryORM.query.get(entry_id)
-        if not obj:
+    def update_fields(self, entry_id: int, fields: dict, autocommit: bool = True) -> Optional[FinanceEntry]:
+        # Single UPDATE ... RETURNING instead of SELECT followed by UPDATE.
+        stmt = (
+            sa_update(FinanceEntryORM)
+            .where(FinanceEntryORM.id == entry_id)
+            .values(**fields)
+            .returning(*_ENTRY_COLUMNS)
+        )
+        row = db.session.execute(stmt).first()
+        if autocommit:
+            db.session.commit()
+        if row is None:
+            return None
+        self._written(entry_id, autocommit)
+        return FinanceEntry(*row)
+
+    def delete(self, entry_id: int, autocommit: bool = True) -> bool:
+        result = db.session.execute(sa_delete(FinanceEntryORM).where(FinanceEntryORM.id == entry_id))
+        # End the transaction even when nothing matched, so SQLite's write lock
+        # taken by the DELETE is not held until request teardown.
+        _end_mutation(autocommit)
+        if result.rowcount == 0:
             return False
-        db.session.delete(obj)
-        db.session.commit()
+        self._written(entry_id, autocommit)
         return True
+
+    @contextmanager
+    def unit_of_work(self):
+        try:
+            yield self
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            # Invalidate only once the deferred writes are committed (or discarded),
+            # so concurrent readers can't re-cache the pre-commit rows.
+            db.session.info.pop(_PENDING_INSERTS, None)
+            for entry_id in db.session.info.pop(_PENDING_INVALIDATIONS, ()):
+                self._cache.invalidate(entry_id)
@@ -0,0 +1,29 @@
+"""
+SQLite connection tuning (Infrastructure layer).
+"""
+
+from sqlalchemy import event
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# PUBLIC_INTERFACE
+def enable_sqlite_pragmas(engine):
+    """
+    Apply WAL journaling and cache pragmas to every new SQLite connection.
+    No-op for other database backends.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
@@ -0,0 +1,20 @@
+import os
+
+# Config reads the environment at import time, so point it at an in-memory
+# database before the package is imported.
+os.environ["FINANCE_DB_URI"] = "sqlite://"
+
+import pytest
+
+from finance_tracker_backend.app import create_app
+from finance_tracker_backend.infrastructure.persistence.db_models import db
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,79 @@
+from datetime import date
+
+import pytest
+
+from finance_tracker_backend.domain.finance_entry.entities import FinanceEntry
+from finance_tracker_backend.infrastructure.persistence.db_models import db, FinanceEntryORM
+from finance_tracker_backend.infrastructure.persistence.sqlalchemy_repo import SQLAlchemyFinanceEntryRepository
+
+
+def _entry(description="Coffee", amount=1.0):
+    return FinanceEntry(None, description, amount, "Food", date(2024, 1, 2))
+
+
+@pytest.fixture
+def repo(app):
+    return SQLAlchemyFinanceEntryRepository(cache_size=100)
+
+
+def test_rolled_back_add_is_not_cached(repo):
+    with pytest.raises(RuntimeError):
+        with repo.unit_of_work():
+            phantom = repo.add(_entry("Phantom"), autocommit=False)
+            assert repo.get_by_id(phantom.id).description == "Phantom"
+            raise RuntimeError("abort")
+
+    assert db.session.get(FinanceEntryORM, phantom.id) is None
+    assert repo.get_by_id(phantom.id) is None
+
+    # SQLite reuses the rolled-back rowid for the next insert.
+    real = repo.add(_entry("Real"))
+    assert real.id == phantom.id
+    assert repo.get_by_id(real.id).description == "Real"
+
+
+def test_rolled_back_bulk_add_is_not_cached(repo):
+    with pytest.raises(RuntimeError):
+        with repo.unit_of_work():
+            repo.bulk_add([_entry("Phantom")], autocommit=False)
+            new_id = db.session.query(FinanceEntryORM.id).scalar()
+            assert repo.get_by_id(new_id).description == "Phantom"
+            raise RuntimeError("abort")
+
+    assert repo.get_by_id(new_id) is None
+    repo.add(_entry("Real"))
+    assert repo.get_by_id(new_id).description == "Real"
+
+
+def test_deferred_update_invalidates_after_commit(repo):
+    entry = repo.add(_entry(amount=1.0))
+    assert repo.get_by_id(entry.id).amount == 1.0
+
+    with repo.unit_of_work():
+        repo.update_fields(entry.id, {"amount": 99.0}, autocommit=False)
+
+    assert repo.get_by_id(entry.id).amount == 99.0
+
+
+def test_cache_drops_put_that_raced_an_invalidation(repo):
+    cache = repo._cache
+    stale = repo.add(_entry(amount=1.0))
+    generation = cache.generation()
+    cache.invalidate(stale.id)
+    cache.put(stale, generation)
+    assert cache.get(stale.id) is None
+
+
+def test_bulk_add_returns_ids_in_order(repo):
+    entries = [_entry(f"Entry {i}", float(i)) for i in range(50)]
+    assert repo.bulk_add(entries, return_ids=True) == 50
+
+    stored = repo.get_many(e.id for e in entries)
+    assert [stored[e.id].description for e in entries] == [e.description for e in entries]
+
+
+def test_bulk_add_without_ids_returns_count(repo):
+    entries = [_entry() for _ in range(5)]
+    assert repo.bulk_add(entries) == 5
+    assert all(e.id is None for e in entries)
+    assert db.session.query(FinanceEntryORM).count() == 5